@@ -2,9 +2,16 @@ const DATA_URL = "../data/itineraries.json";
 const MIN_DAYS = 3;
 const MAX_DAYS = 10;
 const SCHEDULE_ORDER = ["morning", "afternoon", "evening", "late"];
+const cityCollator = new Intl.Collator();
+const dayLabelFormat = new Intl.DateTimeFormat(undefined, {
+  weekday: "short",
+  month: "short",
+  day: "numeric",
+});
 
 const state = {
   destinations: [],
+  destinationsById: new Map(),
   ready: false,
 };
 
@@ -24,6 +31,7 @@ async function loadDestinations() {
     }
     const payload = await response.json();
     state.destinations = payload;
+    state.destinationsById = new Map(payload.map((destination) => [destination.id, destination]));
     state.ready = true;
     populateDestinationSelect(select, payload);
   } catch (error) {
@@ -32,7 +40,7 @@ async function loadDestinations() {
 }
 
 function populateDestinationSelect(select, destinations) {
-  const sorted = [...destinations].sort((a, b) => a.city.localeCompare(b.city));
+  const sorted = [...destinations].sort((a, b) => cityCollator.compare(a.city, b.city));
   sorted.forEach((destination) => {
     const option = document.createElement("option");
     option.value = destination.id;
@@ -53,7 +61,7 @@ function handleSubmit(event) {
     renderPlaceholder("Pick a destination to start planning.");
     return;
   }
-  const destination = state.destinations.find((item) => item.id === destinationId);
+  const destination = state.destinationsById.get(destinationId);
   if (!destination) {
     renderPlaceholder("That destination is missing from the dataset. Try another city or update the JSON.");
     return;
@@ -106,6 +114,9 @@ function pickFlexDays(flexDays, count, styles) {
   if (!flexDays.length || count <= 0) {
     return [];
   }
+  if (!styles.size) {
+    return flexDays.slice(0, count);
+  }
   const scored = flexDays.map((day) => ({
     day,
     score: styleMatchScore(day, styles),
@@ -249,11 +260,7 @@ function formatDayLabel(dayIndex, startDate) {
   if (Number.isNaN(date.valueOf())) {
     return base;
   }
-  const label = date.toLocaleDateString(undefined, {
-    weekday: "short",
-    month: "short",
-    day: "numeric",
-  });
+  const label = dayLabelFormat.format(date);
   return `${base} · ${label}`;
 }
 